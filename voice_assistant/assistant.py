@@ -5,15 +5,18 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Protocol
+from typing import Iterable, Protocol, Sequence
 
 from .lsp import Diagnostic, stream_diagnostics
 from .ocr import OCRResult, capture_screen_text
 from .voice import VoiceCommand, listen_for_command
 
+_BATCH_DEBOUNCE_SECONDS = 0.05
+_BATCH_MAX_SIZE = 256
+
 
 class DiagnosticListener(Protocol):
-    def __call__(self, diagnostic: Diagnostic) -> None:
+    def __call__(self, diagnostics: Sequence[Diagnostic]) -> None:
         ...
 
 
@@ -34,14 +37,40 @@ class VoiceAssistant:
         self._diagnostic_listeners.append(listener)
 
     async def stream_lsp_diagnostics(self) -> None:
-        async for diagnostic in stream_diagnostics(
-            command=self._config.lsp_command,
-            root_path=self._config.lsp_root,
-            file_path=self._config.lsp_file,
-            language_id=self._config.lsp_language_id,
-        ):
+        loop = asyncio.get_running_loop()
+        buffer: list[Diagnostic] = []
+        flush_handle: asyncio.TimerHandle | None = None
+
+        def _flush() -> None:
+            nonlocal flush_handle
+            flush_handle = None
+            if not buffer:
+                return
+            batch = tuple(buffer)
+            buffer.clear()
             for listener in self._diagnostic_listeners:
-                listener(diagnostic)
+                listener(batch)
+
+        try:
+            async for diagnostic in stream_diagnostics(
+                command=self._config.lsp_command,
+                root_path=self._config.lsp_root,
+                file_path=self._config.lsp_file,
+                language_id=self._config.lsp_language_id,
+            ):
+                buffer.append(diagnostic)
+                if len(buffer) >= _BATCH_MAX_SIZE:
+                    if flush_handle is not None:
+                        flush_handle.cancel()
+                    _flush()
+                    continue
+                if flush_handle is not None:
+                    flush_handle.cancel()
+                flush_handle = loop.call_later(_BATCH_DEBOUNCE_SECONDS, _flush)
+        finally:
+            if flush_handle is not None:
+                flush_handle.cancel()
+            _flush()
 
     def analyze_screen(self, languages: Iterable[str] | None = None) -> OCRResult:
         return capture_screen_text(languages=languages)
@@ -62,11 +91,12 @@ def run_example() -> None:
     )
     assistant = VoiceAssistant(config=config)
 
-    def print_diagnostic(diagnostic: Diagnostic) -> None:
-        print(
-            f"{diagnostic.uri}:{diagnostic.line + 1}:{diagnostic.character + 1} "
-            f"{diagnostic.message}"
-        )
+    def print_diagnostics(diagnostics: Sequence[Diagnostic]) -> None:
+        for diagnostic in diagnostics:
+            print(
+                f"{diagnostic.uri}:{diagnostic.line + 1}:{diagnostic.character + 1} "
+                f"{diagnostic.message}"
+            )
 
-    assistant.on_diagnostic(print_diagnostic)
+    assistant.on_diagnostic(print_diagnostics)
     asyncio.run(assistant.run())
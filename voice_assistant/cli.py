@@ -42,13 +42,14 @@ def main() -> None:
         print(command.text)
 
     if not args.ocr and not args.listen:
-        def print_diagnostic(diagnostic):
-            print(
-                f"{diagnostic.uri}:{diagnostic.line + 1}:{diagnostic.character + 1} "
-                f"{diagnostic.message}"
-            )
-
-        assistant.on_diagnostic(print_diagnostic)
+        def print_diagnostics(diagnostics):
+            for diagnostic in diagnostics:
+                print(
+                    f"{diagnostic.uri}:{diagnostic.line + 1}:{diagnostic.character + 1} "
+                    f"{diagnostic.message}"
+                )
+
+        assistant.on_diagnostic(print_diagnostics)
         asyncio.run(assistant.run())
 
 
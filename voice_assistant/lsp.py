@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from dataclasses import dataclass
+import collections
+import concurrent.futures
 from pathlib import Path
-from typing import Any, AsyncIterator, Callable
+from typing import Any, AsyncIterator, Callable, NamedTuple
 
+import orjson
 
-@dataclass(frozen=True)
-class Diagnostic:
+_dumps = orjson.dumps
+_loads = orjson.loads
+
+_MAX_OUTBOX_BYTES = 256 * 1024
+_PARSE_INLINE_MAX_BYTES = 4096
+
+
+class Diagnostic(NamedTuple):
     uri: str
     message: str
     severity: int
@@ -26,6 +33,10 @@ class LSPClient:
         self._reader_task: asyncio.Task[None] | None = None
         self._message_id = 0
         self._callbacks: dict[str, list[Callable[[dict[str, Any]], None]]] = {}
+        self._outbox = bytearray()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._parse_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self._uri_cache: dict[Path, str] = {}
 
     async def start(self) -> None:
         self._proc = await asyncio.create_subprocess_exec(
@@ -39,7 +50,12 @@ class LSPClient:
             "initialize",
             {
                 "rootUri": self._root_uri,
-                "capabilities": {"textDocument": {"publishDiagnostics": {}}},
+                "capabilities": {
+                    "textDocument": {
+                        "publishDiagnostics": {},
+                        "synchronization": {"change": 2},
+                    }
+                },
             },
         )
         await self._send_notification("initialized", {})
@@ -49,10 +65,18 @@ class LSPClient:
             return
         await self._send_request("shutdown", {})
         await self._send_notification("exit", {})
+        await self._flush_now()
         if self._reader_task:
             self._reader_task.cancel()
         self._proc.terminate()
         await self._proc.wait()
+        self._parse_pool.shutdown(wait=False)
+
+    def _uri(self, path: Path) -> str:
+        uri = self._uri_cache.get(path)
+        if uri is None:
+            uri = self._uri_cache[path] = path.as_uri()
+        return uri
 
     async def open_document(self, path: Path, language_id: str) -> None:
         text = path.read_text(encoding="utf-8")
@@ -60,7 +84,7 @@ class LSPClient:
             "textDocument/didOpen",
             {
                 "textDocument": {
-                    "uri": path.as_uri(),
+                    "uri": self._uri(path),
                     "languageId": language_id,
                     "version": 1,
                     "text": text,
@@ -68,15 +92,21 @@ class LSPClient:
             },
         )
 
-    async def change_document(self, path: Path, text: str, version: int) -> None:
+    async def change_document(
+        self, path: Path, changes: list[dict[str, Any]], version: int
+    ) -> None:
+        """Send incremental edits, each a dict with "range" and "text" keys.
+
+        A change without a "range" replaces the whole document.
+        """
         await self._send_notification(
             "textDocument/didChange",
             {
                 "textDocument": {
-                    "uri": path.as_uri(),
+                    "uri": self._uri(path),
                     "version": version,
                 },
-                "contentChanges": [{"text": text}],
+                "contentChanges": changes,
             },
         )
 
@@ -86,46 +116,86 @@ class LSPClient:
         self._callbacks.setdefault(method, []).append(callback)
 
     async def diagnostics(self) -> AsyncIterator[Diagnostic]:
-        queue: asyncio.Queue[Diagnostic] = asyncio.Queue()
+        buffer: collections.deque[Diagnostic] = collections.deque(maxlen=4096)
+        ready = asyncio.Event()
+        dropped = 0
 
         def handler(params: dict[str, Any]) -> None:
-            uri = params.get("uri", "")
-            for item in params.get("diagnostics", []):
-                message = item.get("message", "")
-                severity = int(item.get("severity", 0))
-                position = item.get("range", {}).get("start", {})
-                line = int(position.get("line", 0))
-                character = int(position.get("character", 0))
-                queue.put_nowait(
+            nonlocal dropped
+            uri = params["uri"]
+            for item in params["diagnostics"]:
+                position = item["range"]["start"]
+                if len(buffer) == buffer.maxlen:
+                    dropped += 1
+                buffer.append(
                     Diagnostic(
-                        uri=uri,
-                        message=message,
-                        severity=severity,
-                        line=line,
-                        character=character,
+                        uri,
+                        item["message"],
+                        item.get("severity", 0),
+                        position["line"],
+                        position["character"],
                     )
                 )
+            ready.set()
 
         self.on_notification("textDocument/publishDiagnostics", handler)
 
         while True:
-            yield await queue.get()
+            if not buffer:
+                ready.clear()
+                await ready.wait()
+            while buffer:
+                yield buffer.popleft()
+            if dropped:
+                count, dropped = dropped, 0
+                yield Diagnostic("", f"dropped {count} diagnostics under load", 1, 0, 0)
 
     async def _send_request(self, method: str, params: dict[str, Any]) -> None:
         self._message_id += 1
-        await self._send_message(
-            {"jsonrpc": "2.0", "id": self._message_id, "method": method, "params": params}
+        body = (
+            b'{"jsonrpc":"2.0","id":'
+            + str(self._message_id).encode("ascii")
+            + b',"method":"'
+            + method.encode("ascii")
+            + b'","params":'
+            + _dumps(params)
+            + b"}"
         )
+        await self._send_raw(body)
 
     async def _send_notification(self, method: str, params: dict[str, Any]) -> None:
-        await self._send_message({"jsonrpc": "2.0", "method": method, "params": params})
+        body = (
+            b'{"jsonrpc":"2.0","method":"'
+            + method.encode("ascii")
+            + b'","params":'
+            + _dumps(params)
+            + b"}"
+        )
+        await self._send_raw(body)
 
-    async def _send_message(self, payload: dict[str, Any]) -> None:
+    async def _send_raw(self, body: bytes) -> None:
         if not self._proc or not self._proc.stdin:
             raise RuntimeError("LSP process not started")
-        body = json.dumps(payload).encode("utf-8")
-        header = f"Content-Length: {len(body)}\r\n\r\n".encode("utf-8")
-        self._proc.stdin.write(header + body)
+        self._outbox += f"Content-Length: {len(body)}\r\n\r\n".encode("ascii")
+        self._outbox += body
+        if len(self._outbox) >= _MAX_OUTBOX_BYTES:
+            await self._flush_now()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        # Yield once so sends issued in the same event-loop step coalesce
+        # into a single write.
+        await asyncio.sleep(0)
+        self._flush_task = None
+        await self._flush_now()
+
+    async def _flush_now(self) -> None:
+        if not self._outbox or not self._proc or not self._proc.stdin:
+            return
+        data = bytes(self._outbox)
+        self._outbox.clear()
+        self._proc.stdin.write(data)
         await self._proc.stdin.drain()
 
     async def _read_loop(self) -> None:
@@ -140,22 +210,37 @@ class LSPClient:
             if content_length <= 0:
                 continue
             body = await reader.readexactly(content_length)
-            message = json.loads(body.decode("utf-8"))
+            if content_length <= _PARSE_INLINE_MAX_BYTES:
+                message = _loads(body)
+            else:
+                # Parse big payloads off-thread so the reader keeps up with
+                # other traffic; orjson releases the GIL in its C parser.
+                message = await asyncio.get_running_loop().run_in_executor(
+                    self._parse_pool, _loads, body
+                )
+            # Release the raw body before dispatching so the allocator can
+            # reuse the slot while callbacks run.
+            del body
             method = message.get("method")
             if method:
                 for callback in self._callbacks.get(method, []):
                     callback(message.get("params", {}))
 
     async def _read_headers(self, reader: asyncio.StreamReader) -> dict[str, str] | None:
+        try:
+            raw = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None
+        # Fast path: Content-Length is the only header we act on.
+        idx = raw.find(b"Content-Length:")
+        if idx != -1:
+            end = raw.index(b"\r\n", idx)
+            return {"content-length": raw[idx + 15 : end].strip().decode("ascii")}
         headers: dict[str, str] = {}
-        while True:
-            line = await reader.readline()
-            if not line:
-                return None
-            if line == b"\r\n":
-                return headers
-            key, value = line.decode("utf-8").split(":", maxsplit=1)
-            headers[key.lower()] = value.strip()
+        for line in raw[:-4].split(b"\r\n"):
+            key, _, value = line.partition(b":")
+            headers[key.lower().decode("utf-8")] = value.strip().decode("utf-8")
+        return headers
 
 
 async def stream_diagnostics(
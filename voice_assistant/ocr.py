@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import importlib.util
+import multiprocessing
+import threading
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Any, Iterable
 
 
 @dataclass(frozen=True)
@@ -13,6 +17,7 @@ class OCRResult:
     confidence: float
 
 
+@functools.lru_cache(maxsize=None)
 def _require_module(module_name: str, install_hint: str) -> None:
     if importlib.util.find_spec(module_name) is None:
         raise RuntimeError(
@@ -20,33 +25,108 @@ def _require_module(module_name: str, install_hint: str) -> None:
         )
 
 
+_SCT: Any = None
+_SCT_LOCK = threading.Lock()
+_TESS_APIS: dict[str, Any] = {}
+_MONITOR_POOL: Any = None
+
+
+def _screen_capturer() -> Any:
+    """Return a shared mss instance, created once on first use.
+
+    Keeping the instance alive keeps its backend capture resources
+    (the X11 shared-memory segment on Linux) mapped between grabs, so
+    polling the screen does not re-allocate them per call.
+    """
+    global _SCT
+    if _SCT is None:
+        with _SCT_LOCK:
+            if _SCT is None:
+                import mss  # type: ignore
+
+                _SCT = mss.mss(with_cursor=False)
+    return _SCT
+
+
+def _tesseract_api(lang: str) -> Any:
+    """Return a cached tesserocr API for the language, loading it once."""
+    api = _TESS_APIS.get(lang)
+    if api is None:
+        import tesserocr  # type: ignore
+
+        api = _TESS_APIS[lang] = tesserocr.PyTessBaseAPI(lang=lang)
+    return api
+
+
+def _monitor_pool(max_workers: int) -> Any:
+    """Return a shared process pool for per-monitor OCR, created once.
+
+    Spawned (not forked) so each worker gets its own mss display
+    connection and tesserocr handles.
+    """
+    global _MONITOR_POOL
+    if _MONITOR_POOL is None:
+        _MONITOR_POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _MONITOR_POOL
+
+
+def _ocr_monitor(monitor_index: int, lang: str) -> tuple[list[str], list[float]]:
+    """Grab one monitor and OCR it, returning word texts and confidences."""
+    import tesserocr  # type: ignore
+
+    sct = _screen_capturer()
+    screenshot = sct.grab(sct.monitors[monitor_index])
+    width, height = screenshot.size
+
+    api = _tesseract_api(lang)
+    # Feed the grab's native BGRA buffer straight to Tesseract; the
+    # .rgb property would byte-swap into a fresh copy first.
+    api.SetImageBytes(bytes(screenshot.raw), width, height, 4, 4 * width)
+    api.Recognize()
+
+    texts: list[str] = []
+    confidences: list[float] = []
+    iterator = api.GetIterator()
+    if iterator is not None:
+        for result in tesserocr.iterate_level(iterator, tesserocr.RIL.WORD):
+            texts.append((result.GetUTF8Text(tesserocr.RIL.WORD) or "").strip())
+            confidences.append(result.Confidence(tesserocr.RIL.WORD))
+    return texts, confidences
+
+
 def capture_screen_text(languages: Iterable[str] | None = None) -> OCRResult:
     _require_module("mss", "pip install mss")
-    _require_module("pytesseract", "pip install pytesseract")
-    _require_module("PIL", "pip install pillow")
+    _require_module("tesserocr", "pip install tesserocr")
+    _require_module("numpy", "pip install numpy")
 
-    import mss  # type: ignore
-    import pytesseract  # type: ignore
-    from PIL import Image  # type: ignore
+    import numpy as np  # type: ignore
 
     lang = "+".join(languages or ["eng"]) if languages else "eng"
-    with mss.mss() as sct:
-        monitor = sct.monitors[0]
-        screenshot = sct.grab(monitor)
-        image = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
-        data = pytesseract.image_to_data(image, lang=lang, output_type=pytesseract.Output.DICT)
-
-    words = []
-    confidences = []
-    for text, confidence in zip(data.get("text", []), data.get("conf", [])):
-        if not text:
-            continue
-        words.append(text)
-        try:
-            confidences.append(float(confidence))
-        except ValueError:
-            continue
-
-    text = " ".join(words).strip()
-    avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+    sct = _screen_capturer()
+    # monitors[0] is the union of all monitors; 1..n are the real ones.
+    monitor_indexes = list(range(1, len(sct.monitors))) or [0]
+    if len(monitor_indexes) == 1:
+        results = [_ocr_monitor(monitor_indexes[0], lang)]
+    else:
+        pool = _monitor_pool(len(monitor_indexes))
+        results = list(
+            pool.map(functools.partial(_ocr_monitor, lang=lang), monitor_indexes)
+        )
+
+    texts: list[str] = []
+    raw_confidences: list[float] = []
+    for monitor_texts, monitor_confidences in results:
+        texts.extend(monitor_texts)
+        raw_confidences.extend(monitor_confidences)
+
+    confidences = np.asarray(raw_confidences, dtype=np.float32)
+    mask = (confidences >= 0) & np.fromiter(
+        (bool(text) for text in texts), dtype=bool, count=len(texts)
+    )
+
+    text = " ".join(word for word, keep in zip(texts, mask) if keep).strip()
+    avg_confidence = float(confidences[mask].mean()) if mask.any() else 0.0
     return OCRResult(text=text, confidence=avg_confidence)
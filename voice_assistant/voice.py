@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 import importlib.util
 from dataclasses import dataclass
+from typing import Any
 
 
 @dataclass(frozen=True)
@@ -12,6 +14,7 @@ class VoiceCommand:
     confidence: float
 
 
+@functools.lru_cache(maxsize=None)
 def _require_module(module_name: str, install_hint: str) -> None:
     if importlib.util.find_spec(module_name) is None:
         raise RuntimeError(
@@ -19,12 +22,40 @@ def _require_module(module_name: str, install_hint: str) -> None:
         )
 
 
+_SR_JSON_PATCHED = False
+
+
+def _patch_recognizer_json(sr: Any) -> None:
+    """Point speech_recognition's json reference at orjson.
+
+    recognize_google parses the service response with the module-level
+    json import; swapping it for an orjson-backed shim speeds up that
+    parse without touching the library.
+    """
+    global _SR_JSON_PATCHED
+    if _SR_JSON_PATCHED:
+        return
+    import orjson
+
+    class _OrjsonModule:
+        loads = staticmethod(orjson.loads)
+
+        @staticmethod
+        def dumps(obj: Any, **_: Any) -> str:
+            return orjson.dumps(obj).decode("utf-8")
+
+    sr.json = _OrjsonModule
+    _SR_JSON_PATCHED = True
+
+
 def listen_for_command(timeout: float = 5.0, phrase_time_limit: float = 10.0) -> VoiceCommand:
     _require_module("speech_recognition", "pip install SpeechRecognition")
     _require_module("pyaudio", "pip install pyaudio")
 
     import speech_recognition as sr  # type: ignore
 
+    _patch_recognizer_json(sr)
+
     recognizer = sr.Recognizer()
     with sr.Microphone() as source:
         recognizer.adjust_for_ambient_noise(source, duration=0.5)